@@ -1,118 +1,147 @@
-from functools import lru_cache
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import math as m
-from collections import defaultdict
+from numba import njit
+
+# Sentinelle entière pour T(n,0) : plus grande que tout coût réel mais
+# encore additionnable deux fois sans déborder l'int64.
+SENT = np.iinfo(np.int64).max // 4
+_INT64_MAX = np.iinfo(np.int64).max
+
+@njit(cache=True)
+def _row_min(T_tab, n, k, lo):
+    """
+    min/argmin de x + T(n-x,k-1) + T(x-1,k) pour x dans [lo, n], en un seul
+    balayage fusionné (pas de tableaux intermédiaires xs/opts).
+    Retourne (min, x optimal gauche, x optimal droit).
+    """
+    best = _INT64_MAX
+    best_xl = lo
+    best_xr = lo
+    for x in range(lo, n + 1):
+        v = x + T_tab[n - x, k - 1] + T_tab[x - 1, k]
+        if v < best:
+            best = v
+            best_xl = x
+            best_xr = x
+        elif v == best:
+            best_xr = x
+    return best, best_xl, best_xr
 
 def argmin_l(l):
-    assert(len(l)>0)
-    p=0
-    v=l[0]
-    for i in range(len(l)):
-        if l[i] - v < 0 :
-            v = l[i]
-            p = i
-    return p
+    # indice du minimum le plus à gauche, réduction min SIMD sans branche Python
+    a = np.asarray(l)
+    assert(a.size > 0)
+    return int(a.argmin())
 
 def argmin_r(l):
-    assert(len(l)>0)
-    p=0
-    v=l[0]
-    for i in range(len(l)):
-        if l[i] - v <= 0 :
-            v = l[i]
-            p = i
-    return p
+    # indice du minimum le plus à droite : argmin sur le tableau renversé
+    a = np.asarray(l)
+    assert(a.size > 0)
+    return a.size - 1 - int(a[::-1].argmin())
+
+
+def compute_T(max_n, max_k, monotone=True):
+    """
+    Remplissage bottom-up de T(n,k) = min_{1<=x<=n} x + T(n-x,k-1) + T(x-1,k).
+
+    Retourne trois tableaux (max_n+1, max_k+1) :
+    T_tab[n,k], Xl_tab[n,k] (x optimal le plus à gauche), Xr_tab (le plus à droite).
+    L'option_list de chaque cellule est évaluée par le noyau njit _row_min
+    au lieu de la récursion Python + lru_cache cellule par cellule.
+
+    Avec monotone=True, le x optimal étant croissant en n à k fixé
+    (optimisation de Knuth), la recherche sur la ligne n est bornée à
+    [x*(n-1,k), n] : O(max_n·max_k) au lieu de O(max_n²·max_k).
+    monotone=False refait la recherche complète (garde-fou de validation).
+    """
+    T_tab = np.full((max_n + 1, max_k + 1), SENT, dtype=np.int64)
+    T_tab[0, :] = 0
+    Xl_tab = np.zeros((max_n + 1, max_k + 1), dtype=np.int64)
+    Xr_tab = np.zeros((max_n + 1, max_k + 1), dtype=np.int64)
+    for k in range(1, max_k + 1):
+        lo = 1
+        for n in range(1, max_n + 1):
+            best, xl, xr = _row_min(T_tab, n, k, lo)
+            T_tab[n, k] = best
+            Xl_tab[n, k] = xl
+            Xr_tab[n, k] = xr
+            if monotone:
+                lo = xl
+    return T_tab, Xl_tab, Xr_tab
 
+max_n = 1024
+max_k = 5
 
-def option_list(n,k):
-    return [x + T(n - x , k - 1) + T(x -1, k) for x in range(1,n+1)]
+# Les datasets interrogent k jusqu'à ⌊log₂(max_n)⌋, on remplit donc jusque-là.
+table_k = max(max_k, int(m.log2(max_n)))
+T_tab, Xl_tab, Xr_tab = compute_T(max_n, table_k)
 
-@lru_cache(maxsize=None)
 def T(n, k):
-    if n == 0:
-        return 0
+    if k >= n:
+        # un checkpoint par élément : chaque pas coûte 1
+        return n
     if k == 0:
-        return float('inf')
-    return min(option_list(n, k))
+        return SENT
+    return int(T_tab[n, k])
 
-@lru_cache(maxsize=None)
 def optimal_x_l(n,k):
     if n == 0:
         return None
     if k == 0:
         return None
-    return argmin_l(option_list(n, k))
+    if k >= n:
+        return 1
+    return int(Xl_tab[n, k])
 
-@lru_cache(maxsize=None)
 def optimal_x_r(n,k):
     if n == 0:
         return None
     if k == 0:
         return None
-    return argmin_r(option_list(n, k))
-    
-
-def compute_T(max_n, max_k):
-    Tableau = [[0] * (max_k + 1) for _ in range(max_n + 1)]
-    for k in range(0, max_k):
-        for n in range(0, max_n):
-            Tableau[n][k] = optimal_x_l(n,k)
-    return Tableau
-    
-max_n = 1024
-max_k = 5
+    if k >= n:
+        return 1
+    return int(Xr_tab[n, k])
 
-T_values = compute_T(max_n, max_k)
+# Les datasets se lisent directement dans les tableaux du DP : une
+# indexation vectorisée par dataset au lieu d'une boucle Python par ligne.
+ns = np.arange(max_n + 1)
 
 ### --- Dataset 1 : k = ⌊log₂(n)⌋ ---
-data_logk = []
-for n in range(max_n + 1):
-    k = max(int(m.log2(n)) if n > 0 else 0, 1)
-    data_logk.append((n, k,T(n, k)))
-
-df_logk = pd.DataFrame(data_logk, columns=["n", "k","T(n,k)"])
-df_logk.to_csv("T_n_logk.csv", index=False)
-
-data_n = []
-for n in range(max_n + 1):
-    k =n
-    data_n.append((n, k, T(n, k)))
+ks_log = np.maximum(np.log2(np.maximum(ns, 1)).astype(np.int64), 1)
+arr_logk = np.column_stack([ns, ks_log, T_tab[ns, ks_log]])
+np.savetxt("T_n_logk.csv", arr_logk, fmt="%d",
+           delimiter=",", header='n,k,"T(n,k)"', comments="")
 
-df_n = pd.DataFrame(data_n, columns=["n", "k", "T(n,k)"])
-df_n.to_csv("T_n_maxn.csv", index=False)
+### --- Dataset : k = n, où T(n,n) = n ---
+arr_n = np.column_stack([ns, ns, ns])
+np.savetxt("T_n_maxn.csv", arr_n, fmt="%d",
+           delimiter=",", header='n,k,"T(n,k)"', comments="")
 
 ### --- Dataset 2 : toutes les valeurs de k = 1 à max_k ---
-data_allk = []
-for k in range(1, max_k + 1):
-    for n in range(1,max_n + 1):
-        if(optimal_x_r(n,k) == optimal_x_l(n,k)) :
-            data_allk.append((n, k,optimal_x_l(n,k), T(n, k)))
-        
-data = []
-for k in range(1, max_k + 1):
-    for n in range(0, max_n + 1):
-        t_val = T(n, k)
-        data.append((n, k, t_val))
-
-df = pd.DataFrame(data, columns=["n", "k", "T(n,k)"])
-
-# --- Calcul des différences ΔT(n,k) = T(n,k) - T(n-1,k)
-delta_data = []
-for k in range(3, max_k + 1):
-    for n in range(1, max_n + 1):
-        t_now = T(n, k)
-        t_prev = T(n, k-1)
-        delta_data.append((n, k, t_prev - t_now))
-
-df_delta = pd.DataFrame(delta_data, columns=["n", "k", "ΔT(n,k)"])
-
-df_allk = pd.DataFrame(data_allk, columns=["n", "k", "opt_x" ,"T(n,k)"])
-df_allk.to_csv("T_n_allk2.csv", index=False)
+# (n, k) où le x optimal est unique : masque Xl == Xr, parcouru k-majeur
+# pour garder l'ordre des lignes d'origine
+uniq_k, uniq_n = np.nonzero((Xl_tab[1:, 1:max_k + 1] == Xr_tab[1:, 1:max_k + 1]).T)
+uniq_n += 1
+uniq_k += 1
+arr_allk = np.column_stack([uniq_n, uniq_k,
+                            Xl_tab[uniq_n, uniq_k], T_tab[uniq_n, uniq_k]])
+np.savetxt("T_n_allk2.csv", arr_allk, fmt="%d",
+           delimiter=",", header='n,k,opt_x,"T(n,k)"', comments="")
+
+arr_all = np.column_stack([np.tile(ns, max_k),
+                           np.repeat(np.arange(1, max_k + 1), max_n + 1),
+                           T_tab[:, 1:max_k + 1].T.ravel()])
+
+# --- Calcul des différences ΔT(n,k) = T(n,k-1) - T(n,k)
+ks_d = np.arange(3, max_k + 1)
+arr_delta = np.column_stack([np.tile(ns[1:], ks_d.size),
+                             np.repeat(ks_d, max_n),
+                             (T_tab[1:, ks_d - 1] - T_tab[1:, ks_d]).T.ravel()])
 """
 ### --- Tracer la courbe pour k = n ---
 plt.figure(figsize=(10, 6))
-plt.plot(df_n["n"], df_n["T(n,k)"], marker='o', label="k = n")
+plt.plot(arr_n[:, 0], arr_n[:, 2], marker='o', label="k = n")
 plt.xlabel("n")
 plt.ylabel("T(n,k)")
 plt.title("T(n, n) en fonction de n")
@@ -124,7 +153,7 @@ plt.show()
 """
 ### --- Tracer la courbe pour k = ⌊log₂(n)⌋ ---
 plt.figure(figsize=(10, 6))
-plt.plot(df_logk["n"], df_logk["T(n,k)"], marker='o', label="k = ⌊log₂(n)⌋")
+plt.plot(arr_logk[:, 0], arr_logk[:, 2], marker='o', label="k = ⌊log₂(n)⌋")
 plt.xlabel("n")
 plt.ylabel("T(n,k)")
 plt.title("T(n, ⌊log₂(n)⌋) en fonction de n")
@@ -136,8 +165,8 @@ plt.show()
 ### --- Tracer les courbes pour tous les k de 1 à max_k ---
 plt.figure(figsize=(10, 6))
 for k in range(1, max_k + 1):
-    subset = df_allk[df_allk["k"] == k]
-    plt.plot(subset["n"], subset["T(n,k)"], marker='o', label=f"k = {k}")
+    subset = arr_allk[arr_allk[:, 1] == k]
+    plt.plot(subset[:, 0], subset[:, 3], marker='o', label=f"k = {k}")
 plt.xlabel("n")
 plt.ylabel("T(n,k)")
 plt.title("T(n,k) en fonction de n pour différents k")
@@ -149,8 +178,8 @@ plt.show()
 # --- Tracer le graphe des différences
 plt.figure(figsize=(10, 6))
 for k in range(1, max_k + 1):
-    subset = df_delta[df_delta["k"] == k]
-    plt.plot(subset["n"], subset["ΔT(n,k)"], label=f"k = {k}")
+    subset = arr_delta[arr_delta[:, 1] == k]
+    plt.plot(subset[:, 0], subset[:, 2], label=f"k = {k}")
 plt.xlabel("n")
 plt.ylabel("ΔT(n,k) = T(n,k) - T(n-1,k)")
 plt.title("Différences successives de T(n,k) selon k")
@@ -14,6 +14,70 @@ Each checkpoint tracks its own index in its own n sequence.
 
 import math
 
+import numpy as np
+from numba import njit
+from sortedcontainers import SortedList
+
+
+@njit(cache=True)
+def _run_full_cycle_nb(pos, n, k, seqs, seq_lens, idx):
+    """
+    Forward sweep to n then backward sweep to 0, entirely in nopython mode.
+
+    seqs is the padded (k+1, max_len) int64 copy of the per-level sequences,
+    seq_lens the valid length of each row, idx the k checkpoint indices
+    (mutated in place). Returns the ops performed.
+    """
+    ops = 0
+    # forward: next() n times
+    while pos < n:
+        pos += 1
+        ops += 1
+        pos_at_level = pos
+        for j in range(k):
+            m = k - j
+            seq = seqs[m, :seq_lens[m]]
+            new_idx = np.searchsorted(seq, pos_at_level, side='right') - 1
+            if new_idx < 0:
+                new_idx = 0
+            if idx[j] != new_idx:
+                lower_anchor = 0
+                for jj in range(k):
+                    m_prev = k - jj
+                    candidate = seqs[m_prev, idx[jj]]
+                    if candidate < seq[new_idx] and candidate > lower_anchor:
+                        lower_anchor = candidate
+                ops += seq[new_idx] - lower_anchor
+            idx[j] = new_idx
+            if new_idx < seq_lens[m]:
+                pos_at_level -= seq[new_idx]
+    # backward: prev() until pos == 0
+    while pos > 0:
+        target = pos - 1
+        j_dec = -1
+        for j in range(k - 1, -1, -1):
+            if idx[j] > 0:
+                j_dec = j
+                break
+        if j_dec < 0:
+            # All checkpoints at 0, can only go to 0
+            pos = 0
+            for j in range(k):
+                idx[j] = 0
+            continue
+        idx[j_dec] -= 1
+        for jj in range(j_dec + 1, k):
+            m = k - jj
+            idx[jj] = seq_lens[m] - 1
+        prev_pos = 0
+        for j in range(k):
+            m = k - j
+            prev_pos += seqs[m, idx[j]]
+        if target >= prev_pos:
+            ops += target - prev_pos
+        pos = target
+    return ops
+
 
 class RecursiveCheckpointEnumerator:
     """
@@ -31,22 +95,25 @@ class RecursiveCheckpointEnumerator:
             self.n_sequences[k-m] = self._compute_n_sequence(k-m)
 
         self.checkpoint_indices = [0] * k
-    
-    def _binomial(self, n, k):
-        """Compute C(n, k)"""
-        if k > n or k < 0:
-            return 0
-        if k == 0 or k == n:
-            return 1
-        k = min(k, n - k)
-        result = 1
-        for i in range(k):
-            result = result * (n - i) // (i + 1)
-        return result
-    
-    def _compute_n_sequence(self, m: int) -> list:
+        self._pos_cached = self._sum_checkpoint_position()
+        # multiset trié des valeurs courantes seq[m][idx[j]], pour la
+        # requête lower_anchor en O(log k) au lieu d'un balayage O(k)
+        self._cp_vals = self._build_cp_vals()
+
+        # padded 2-D copy of the sequences for the njit kernel
+        max_len = max(len(self.n_sequences[m]) for m in self.n_sequences)
+        self._seqs = np.zeros((k + 1, max_len), dtype=np.int64)
+        self._seq_lens = np.zeros(k + 1, dtype=np.int64)
+        for m, seq in self.n_sequences.items():
+            self._seqs[m, :len(seq)] = seq
+            self._seq_lens[m] = len(seq)
+
+    def _compute_n_sequence(self, m: int) -> np.ndarray:
         """
-        Compute n_m(i) = C(m+i-1, m) for i = 0, 1, 2, ...
+        Compute n_m(i) = C(m+i-1, m) for i = 0, 1, 2, ... as an int64 array.
+
+        Uses the ratio C(m+i-1, m) / C(m+i-2, m) = (m+i-1)/(i-1), so each
+        element costs one mul + one div instead of an O(m) binomial loop.
         """
         seq = []
         i = 1
@@ -54,25 +121,48 @@ class RecursiveCheckpointEnumerator:
         if m == self.k :
             limit = self.n
         else:
-            length = len(self.n_sequences[m+1])
-            limit = self.n_sequences[m+1][length-1] - self.n_sequences[m+1][length-2] - 1
+            # Borne atteignable du niveau : un checkpoint de niveau m ne se
+            # déplace que dans l'intervalle entre deux valeurs consécutives
+            # du niveau au-dessus. Tronquer ici réduit d'autant le domaine
+            # des recherches dichotomiques de _update_checkpoints.
+            upper = self.n_sequences[m+1]
+            limit = int(upper[-1] - upper[-2] - 1)
         while val < limit:
-            val = self._binomial(m + i - 1, m)
+            # formes closes pour les niveaux les plus fréquents
+            if m == 1:
+                val = i
+            elif m == 2:
+                val = i * (i + 1) // 2
+            elif m == 3:
+                val = i * (i + 1) * (i + 2) // 6
+            elif i == 1:
+                val = 1  # C(m, m)
+            else:
+                val = val * (m + i - 1) // (i - 1)
             seq.append(val)
             i += 1
-        return seq
+        return np.asarray(seq, dtype=np.int64)
     
     def _get_checkpoint_position(self) -> int:
         """
-        Reconstruct absolute position from checkpoint indices.
-        
+        Absolute position from checkpoint indices, maintained incrementally.
+
         pos = n_k(i_0) + n_{k-1}(i_1) + ... + n_1(i_{k-1})
         """
+        return self._pos_cached
+
+    def _build_cp_vals(self) -> SortedList:
+        """Multiset of the sequence values currently pointed at by each level."""
+        return SortedList(int(self.n_sequences[self.k - j][self.checkpoint_indices[j]])
+                          for j in range(self.k))
+
+    def _sum_checkpoint_position(self) -> int:
+        """Full O(k) reconstruction, used to (re)seed the cached position."""
         total = 0
         for j in range(self.k):
             m = self.k - j
             idx = self.checkpoint_indices[j]
-            total += self.n_sequences[m][idx]
+            total += int(self.n_sequences[m][idx])
         return total
     
     def _update_checkpoints(self):
@@ -89,29 +179,23 @@ class RecursiveCheckpointEnumerator:
             m = self.k - j
             seq = self.n_sequences[m]
             
-            idx = 0
-            if self.checkpoint_indices[j] == 0 :
-                start = 0
-            else :
-                start = self.checkpoint_indices[j]-1
-            for i in range(start, len(seq)+1):
-                if seq[i] <= pos_at_level:
-                    idx = i
-                else:
-                    break
+            # largest i with seq[i] <= pos_at_level, via binary search in C
+            idx = int(np.searchsorted(seq, pos_at_level, side='right')) - 1
+            if idx < 0:
+                idx = 0
             if self.checkpoint_indices[j] != idx:
-                lower_anchor=0
-                for jj in range(self.k):
-                    m_prev = self.k - jj
-                    seq_prev = self.n_sequences[m_prev]
-                    idx_prev = self.checkpoint_indices[jj]
-                    
-                    candidate = seq_prev[idx_prev]
-                    if candidate < seq[idx] and candidate > lower_anchor:
-                        lower_anchor = candidate
-                
-                cost = seq[idx] - lower_anchor
+                new_val = int(seq[idx])
+                old_val = int(seq[self.checkpoint_indices[j]])
+                # plus grande valeur de checkpoint strictement < new_val
+                # (0 s'il n'y en a pas), cherchée dans le multiset trié
+                rank = self._cp_vals.bisect_left(new_val)
+                lower_anchor = self._cp_vals[rank - 1] if rank > 0 else 0
+
+                cost = new_val - lower_anchor
                 self.ops += cost
+                self._pos_cached += new_val - old_val
+                self._cp_vals.remove(old_val)
+                self._cp_vals.add(new_val)
             self.checkpoint_indices[j] = idx
             
             if idx < len(seq):
@@ -136,49 +220,53 @@ class RecursiveCheckpointEnumerator:
             return False
         
         target = self.pos - 1
-        
-        # Find nearest checkpoint before current position
-        prev_checkpoints = self.checkpoint_indices[:]
-        
-        # Decrement from the deepest level that can decrement
-        can_decrement = False
+        indices = self.checkpoint_indices
+
+        # Find the deepest level that can decrement; mutate the index list
+        # in place instead of building a speculative copy per call
+        j_dec = -1
         for j in range(self.k - 1, -1, -1):
-            if self.checkpoint_indices[j] > 0:
-                prev_checkpoints = self.checkpoint_indices[:]
-                prev_checkpoints[j] -= 1
-                # Propagate to deeper levels
-                for jj in range(j + 1, self.k):
-                    m = self.k - jj
-                    prev_checkpoints[jj] = len(self.n_sequences[m]) - 1
-                can_decrement = True
+            if indices[j] > 0:
+                j_dec = j
                 break
-        
-        if not can_decrement:
+
+        if j_dec < 0:
             # All checkpoints at 0, can only go to 0
             self.pos = 0
-            self.checkpoint_indices = [0] * self.k
+            self._pos_cached = self._sum_checkpoint_position()
             return True
-        
+
+        indices[j_dec] -= 1
+        # Propagate to deeper levels
+        for jj in range(j_dec + 1, self.k):
+            m = self.k - jj
+            indices[jj] = len(self.n_sequences[m]) - 1
+        self._cp_vals = self._build_cp_vals()
+
         # Calculate cost: distance to nearest previous checkpoint
         prev_pos = 0
         for j in range(self.k):
             m = self.k - j
-            prev_pos += self.n_sequences[m][prev_checkpoints[j]]
-        
+            prev_pos += int(self.n_sequences[m][indices[j]])
+
         cost = target - prev_pos if target >= prev_pos else 0
         self.ops += cost
-        
+
         self.pos = target
-        self.checkpoint_indices = prev_checkpoints
-        
+        self._pos_cached = prev_pos
+
         return True
     
     def run_full_cycle(self):
-        """Execute forward then backward."""
-        while self.next():
-            pass
-        while self.pos > 0:
-            self.prev()
+        """Execute forward then backward via the njit kernel."""
+        idx = np.asarray(self.checkpoint_indices, dtype=np.int64)
+        ops = _run_full_cycle_nb(self.pos, self.n, self.k,
+                                 self._seqs, self._seq_lens, idx)
+        self.ops += int(ops)
+        self.pos = 0
+        self.checkpoint_indices = [int(i) for i in idx]
+        self._pos_cached = self._sum_checkpoint_position()
+        self._cp_vals = self._build_cp_vals()
     
     def get_checkpoints(self) -> list:
         """Get actual checkpoint positions."""
@@ -187,7 +275,7 @@ class RecursiveCheckpointEnumerator:
         for j in range(self.k):
             m = self.k - j
             idx = self.checkpoint_indices[j]
-            pos += self.n_sequences[m][idx]
+            pos += int(self.n_sequences[m][idx])
             checkpoints.append(pos)
         return checkpoints
     
@@ -1,32 +1,79 @@
 import math
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=32)
+def _mask_table(max_level):
+    """
+    Masques de niveau, immuables pour un max_level donné : calculés une
+    fois et partagés entre toutes les instances (les sweeps du __main__
+    recréent un énumérateur par n).
+
+    Rangés dans l'ordre du tampon de checkpoints : indice 0 = niveau 0
+    (toujours la position 0), indice i >= 1 = niveau max_level+1-i.
+    Tableau int64 en lecture seule, construit vectorisé.
+    """
+    masks = np.zeros(max_level + 1, dtype=np.int64)
+    ks = np.arange(max_level, 0, -1, dtype=np.int64)
+    masks[1:] = ~((np.int64(1) << ks) - 1)
+    masks.setflags(write=False)
+    return masks
+
+
+@lru_cache(maxsize=32)
+def _back_cost_table(n, max_level):
+    """
+    Coût de recul pour chaque cible, précalculé d'un bloc : les checkpoints
+    sont une fonction pure de pos, donc « quel checkpoint est derrière la
+    cible t en venant de t+1 » se calcule vectorisé pour tout le parcours,
+    au lieu d'une recherche dichotomique par pas.
+    """
+    masks = _mask_table(max_level)
+    targets = np.arange(n, dtype=np.int64)
+    cps = (targets[:, None] + 1) & masks[None, :]
+    behind = np.where(cps <= targets[:, None], cps, 0)
+    costs = targets - behind.max(axis=1)
+    costs.setflags(write=False)
+    return costs
+
 
 class logenumerator:
     def __init__(self, n: int):
         self.n = n
         self.pos = 0
         self.ops = 0
-        # On utilise un dictionnaire pour stocker les checkpoints par niveau
-        # pour simuler l'accès mémoire. Clé = niveau k, Valeur = position
-        self.checkpoints = {0: 0} 
-        
+        # Le nombre de niveaux nécessaires est log2(n) : fixe pour un n
+        # donné, on le calcule une seule fois ici plutôt qu'à chaque pas.
+        self.max_level = math.ceil(math.log2(n)) if n > 0 else 1
+        # Checkpoints par niveau, rangés par position croissante :
+        # l'indice 0 est le niveau 0 (le début, toujours 0), l'indice i >= 1
+        # correspond au niveau max_level+1-i. Comme le marqueur de niveau k
+        # est pos sans ses k derniers bits, cet ordre est trié par position,
+        # ce qui permet la recherche dichotomique dans prev().
+        # Capacité fixe connue d'avance (max_level+1 cellules) : un tampon
+        # int64 contigu, aucune réallocation pendant le parcours. Avec la
+        # table de masques partagée, tout ce qui est statique pour un n
+        # donné est construit ici une seule fois ; next()/prev() ne
+        # recalculent plus aucune structure.
+        self.checkpoints = np.zeros(self.max_level + 1, dtype=np.int64)
+        self.masks = _mask_table(self.max_level)
+        self.back_costs = _back_cost_table(n, self.max_level)
+        # Coût total de la descente n -> 0 : somme de la table, figée ici.
+        self._cycle_back_ops = int(self.back_costs.sum())
+
     def _update_checkpoints(self):
         """
-        La logique de Raskin : pour chaque niveau k, 
+        La logique de Raskin : pour chaque niveau k,
         on garde le marqueur correspondant à pos sans ses k derniers bits.
         """
-        # Le nombre de niveaux nécessaires est log2(n)
-        max_level = math.ceil(math.log2(self.n)) if self.n > 0 else 1
-        
-        new_checks = {0: 0} # Le début est toujours là
-        for k in range(1, max_level + 1):
-            # Position du marqueur de niveau k pour la position actuelle
-            marker_pos = self.pos & ~((1 << k) - 1)
-            new_checks[k] = marker_pos
-            
-        # On simule le coût de recomputation si un nouveau checkpoint 
+        # Tous les niveaux d'un coup : un seul ET bit-à-bit vectorisé écrit
+        # dans le tampon existant (le masque nul du niveau 0 garde le début).
+        np.bitwise_and(self.pos, self.masks, out=self.checkpoints)
+        # On simule le coût de recomputation si un nouveau checkpoint
         # doit être créé à partir d'un ancien.
         # Dans le modèle Raskin, on ne recule jamais "dans le vide"
-        self.checkpoints = new_checks
 
     def next(self) -> bool:
         if self.pos >= self.n:
@@ -41,28 +88,23 @@ class logenumerator:
             return False
         
         target = self.pos - 1
-        
-        # Trouver le checkpoint le plus proche derrière la cible
-        # (Dans l'algo de Raskin, il y en a toujours un très proche)
-        closest_check = 0
-        for cp in self.checkpoints.values():
-            if cp <= target:
-                closest_check = max(closest_check, cp)
-        
-        # Coût pour reconstruire l'état depuis le checkpoint
-        self.ops += (target - closest_check)
-        
+
+        # Coût pour reconstruire l'état depuis le checkpoint le plus proche
+        # derrière la cible, lu dans la table précalculée (int() évite de
+        # propager un scalaire NumPy boxé dans le compteur)
+        self.ops += int(self.back_costs[target])
+
         self.pos = target
         self._update_checkpoints()
         return True
 
     def run_full_cycle(self):
-        # Aller jusqu'au bout
-        while self.next():
-            pass
-        # Revenir au début
-        while self.pos > 0:
-            self.prev()
+        # Aller-retour complet en forme close : la montée coûte 1 op par
+        # position restante, la descente est la somme précalculée des coûts
+        # de recul — plus aucune boucle par pas.
+        self.ops += (self.n - self.pos) + self._cycle_back_ops
+        self.pos = 0
+        self._update_checkpoints()
 
     def get_metrics(self):
         n_logn = math.ceil(self.n * math.log2(self.n))
@@ -72,7 +114,7 @@ class logenumerator:
             'n_logn': n_logn,
             'ratio_logn': self.ops / n_logn if n_logn > 0 else 0,
             'ratio_n': self.ops / self.n if self.n > 0 else 0,
-            'mem': len(set(self.checkpoints.values())),
+            'mem': int(np.unique(self.checkpoints).size),
         }
     
 if __name__ == "__main__":